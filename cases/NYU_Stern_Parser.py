@@ -1,126 +1,329 @@
+import hashlib
+import mmap
+import os
 import re
 import json
+import shelve
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional
 
+try:
+    import orjson  # C-accelerated JSON serialization, optional
+except ImportError:
+    orjson = None
+
+
+# Compiled once at import time; the extractors below run these against every case.
+# Terminators are consumed with (?:...) rather than (?=...); only group(1) is read, so the
+# captured text is the same either way.
+_AUTHOR_RE = re.compile(r'(?i)Author[s]?:\s*(.+?)(?:Firm|$)')
+_FIRM_RE = re.compile(r'(?i)Firm.*?:\s*(.+?)(?:\[|\n)')
+_STYLE_RE = re.compile(r'(?i)\[(.*?-led)\]')
+_QUANT_RE = re.compile(r'Quant:\s*(\d+)')
+_STRUCTURE_RE = re.compile(r'Structure:\s*(\d+)')
+_PROMPT_RE = re.compile(r'(?s)Case Prompt:\s*\n(.+?)(?:\n\n|Case Overview:|$)')
+_INDUSTRY_RE = re.compile(r'Industry:\s*(.+?)(?:\n|$)')
+_CASE_STRUCTURE_RE = re.compile(r'(?s)Case Structure:\s*(.+?)(?:\n|Concepts)')
+_BULLET_RE = re.compile(r'[•●]\s*(.+?)(?:\n|$)')
+_QUESTION_PROMPT_RE = re.compile(r'(?s):\s*(.+?)(?:\n\n|Math Solution|Notes to Interviewer|$)')
+_QUESTION_SOLUTION_RE = re.compile(r'(?s)(?:Math Solution|Notes to Interviewer):\s*(.+?)$')
+_DIGITS_RE = re.compile(r'^\d+$')
+_WHITESPACE_RE = re.compile(r'\s*')
+# A line that starts with "Author" once surrounding whitespace is stripped
+_AUTHOR_LINE_RE = re.compile(r'^[^\S\n]*Author', re.MULTILINE)
+
+# Section headers the extractors key off. Their offsets are found once per case so each
+# extractor can start its own pattern at its header instead of rescanning the case from
+# the top, and skip the search entirely when the header is absent. Plain str.find is used
+# for the literal headers; only the case-insensitive ones below need a regex.
+_SECTION_HEADERS = {
+    'quant': ('Quant:',),
+    'structure': ('Structure:',),
+    'case_structure': ('Case Structure:',),
+    'prompt': ('Case Prompt:',),
+    'industry': ('Industry:',),
+    'concepts': ('Concepts Tested:',),
+    'overview_info': ('Overview Information for Interviewer:',),
+    'clarifying': ('Clarifying Information:',),
+    'guide': ('Interviewer Guide:',),
+    'question': ('Math', 'Brainstorming', 'Question'),
+    'exhibit': ('Exhibit',),
+    'recommendation': ('Recommendation:',),
+    'bonus': ('Bonus:',),
+}
+# Headers matched case-insensitively by their extractors
+_CI_SECTION_RES = {
+    'author': re.compile(r'(?i)Author[s]?:'),
+    'firm': re.compile(r'(?i)Firm'),
+}
+
+# Question headers ("Math 2:", "Brainstorming:", "Question #3:"). Each question runs from its
+# header to the next of _QUESTION_TERMINATORS, which are located with str.find
+_QUESTION_HEADER_RE = re.compile(r'(?:Math|Brainstorming|Question)\s*(?:#?\d+)?:')
+_QUESTION_TERMINATORS = ('Math', 'Brainstorming', 'Question', 'Recommendation:', 'Exhibit')
+
+# findall() must not consume the next exhibit's header, so this keeps its lookahead
+_EXHIBIT_RE = re.compile(r'Exhibit\s+\d+.*?(?=Exhibit\s+\d+|Question|Recommendation|$)', re.DOTALL)
+
+def _search_from(pattern, text: str, sections: Dict[str, int], key: str):
+    """Search for pattern from the first offset of its section header, or None if it is absent"""
+    pos = sections.get(key)
+    if pos is None:
+        return None
+    return pattern.search(text, pos)
+
+
+def _find_first(text: str, needles: tuple, start: int) -> int:
+    """Offset of the earliest of needles in text at or after start, or -1"""
+    offsets = [pos for pos in (text.find(n, start) for n in needles) if pos >= 0]
+    return min(offsets) if offsets else -1
+
+
+def _question_sections(text: str, start: int) -> List[str]:
+    r"""Split text from start into question sections, each from its header to the next terminator.
+
+    Same sections as re.findall(r'((?:Math|Brainstorming|Question)\s*(?:#?\d+)?:.*?(?=(?:Math|...|$)))',
+    text, re.DOTALL), whose lazy body tested five alternatives at every offset. Each terminator's
+    next offset is kept and only searched for again once the scan has moved past it, so the
+    whole split stays linear in the length of the text.
+    """
+    sections = []
+    # None: not searched yet, -1: no further occurrence in the text
+    next_offsets = dict.fromkeys(_QUESTION_TERMINATORS)
+    # `$` matches before a trailing newline as well as at the very end
+    text_end = len(text) - 1 if text.endswith('\n') else len(text)
+    pos = start
+    while True:
+        header = _QUESTION_HEADER_RE.search(text, pos)
+        if not header:
+            return sections
+        body_start = header.end()
+        end = text_end
+        for term, offset in next_offsets.items():
+            if offset is None or 0 <= offset < body_start:
+                offset = next_offsets[term] = text.find(term, body_start)
+            if 0 <= offset < end:
+                end = offset
+        sections.append(text[header.start():end])
+        pos = end
+
+
+def _body_after(text: str, start: int, terminators: tuple) -> Optional[str]:
+    r"""Stripped text from start up to the first terminator (or the end), None if nothing follows.
+
+    Captures exactly what re.search(r'HEADER:\s*(.+?)(?=T1|T2|$)', text, re.DOTALL) did for a
+    header ending at start, but with str.find so a missing terminator costs one C-level scan
+    instead of the regex engine testing every alternative at every offset.
+    """
+    if start >= len(text):
+        return None
+    body_start = _WHITESPACE_RE.match(text, start).end()
+    end = _find_first(text, terminators, body_start + 1)
+    return text[body_start:end if end >= 0 else None].strip()
+
+
+def _section_body(text: str, sections: Dict[str, int], key: str, terminators: tuple) -> Optional[str]:
+    """_body_after() for an indexed section header, None if the header is absent"""
+    pos = sections.get(key)
+    if pos is None:
+        return None
+    return _body_after(text, pos + len(_SECTION_HEADERS[key][0]), terminators)
+
+
+def write_json(data, output_path: str):
+    """Write data to output_path as indented UTF-8 JSON, via orjson when it is installed"""
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _parse_case_safely(parser: 'CasebookParser', case_text: str):
+    """Run parser.parse_case, returning (case_data, None) or (None, error message)"""
+    try:
+        return parser.parse_case(case_text), None
+    except Exception as e:
+        return None, str(e)
+
+
+# Set in each pool worker by _init_worker. parse_case uses no instance state, so workers get
+# a bare instance of the parser's class and never receive full_text or the parsed cases;
+# only the class itself (by reference) and the case texts are pickled.
+_worker_parser = None
+
+
+def _init_worker(parser_class: type):
+    global _worker_parser
+    _worker_parser = parser_class.__new__(parser_class)
+
+
+def _parse_in_worker(case_text: str):
+    return _parse_case_safely(_worker_parser, case_text)
+
+
+@lru_cache(maxsize=None)
+def _parser_fingerprint() -> bytes:
+    r"""Digest of everything besides the case text that decides parse output.
+
+    That is this module's source, so cached parses are dropped whenever the extractors change,
+    plus the Unicode database version behind re's \s and str.strip(), so a shelf shared between
+    interpreters never serves results computed under different whitespace rules.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(__file__, 'rb') as f:
+        digest.update(f.read())
+    digest.update(unicodedata.unidata_version.encode('ascii'))
+    return digest.digest()
+
+
+def _case_cache_key(parser_class: type, case_text: str) -> str:
+    """Cache key for a case: blake2b over the parser fingerprint, the parser class and the case text
+
+    The class is part of the key so a subclass that overrides extractors never shares entries
+    with CasebookParser or another subclass in the same shelf.
+    """
+    digest = hashlib.blake2b(_parser_fingerprint())
+    digest.update(f'{parser_class.__module__}.{parser_class.__qualname__}'.encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(case_text.encode('utf-8'))
+    return digest.hexdigest()
+
+
 class CasebookParser:
     """Parser for NYU Stern Casebook to extract case studies into DynamoDB-ready JSON format"""
     
     def __init__(self, text_file_path: str):
-        with open(text_file_path, 'r', encoding='utf-8') as f:
-            self.full_text = f.read()
+        self.full_text = self._read_text(text_file_path)
         self.cases = []
     
-    def extract_case_metadata(self, case_text: str) -> Dict:
+    @staticmethod
+    def _read_text(text_file_path: str) -> str:
+        """Read the casebook text, decoding straight from a read-only mmap of the file
+
+        This avoids holding a full bytes copy of the file next to the decoded str while loading.
+        """
+        with open(text_file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return ''
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                text = str(mm, 'utf-8')
+        # Match text-mode reading, which translates \r\n and lone \r to \n
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+    
+    def extract_case_metadata(self, case_text: str, sections: Optional[Dict[str, int]] = None) -> Dict:
         """Extract metadata like title, author, firm, difficulty, etc."""
+        if sections is None:
+            sections = self.index_sections(case_text)
         metadata = {}
         
-        # Extract title (first line of case)
-        lines = case_text.strip().split('\n')
-        metadata['title'] = lines[0].strip() if lines else ""
+        # Extract title (first non-blank line of case), without splitting the whole case into lines
+        title_start = _WHITESPACE_RE.match(case_text).end()
+        title_end = case_text.find('\n', title_start)
+        metadata['title'] = case_text[title_start:title_end if title_end >= 0 else None].strip()
         
         # Extract author and firm info
-        author_match = re.search(r'Author[s]?:\s*(.+?)(?:Firm|$)', case_text, re.IGNORECASE)
+        author_match = _search_from(_AUTHOR_RE, case_text, sections, 'author')
         if author_match:
             metadata['author'] = author_match.group(1).strip()
         
-        firm_match = re.search(r'Firm.*?:\s*(.+?)(?:\[|\n)', case_text, re.IGNORECASE)
+        firm_match = _search_from(_FIRM_RE, case_text, sections, 'firm')
         if firm_match:
             metadata['firm_style'] = firm_match.group(1).strip()
         
         # Extract case style (interviewer-led, candidate-led, etc.)
-        style_match = re.search(r'\[(.*?-led)\]', case_text, re.IGNORECASE)
+        style_match = _STYLE_RE.search(case_text)
         if style_match:
             metadata['case_style'] = style_match.group(1).strip()
         
         # Extract difficulty ratings
-        quant_match = re.search(r'Quant:\s*(\d+)', case_text)
+        quant_match = _search_from(_QUANT_RE, case_text, sections, 'quant')
         if quant_match:
             metadata['quant_difficulty'] = int(quant_match.group(1))
         
-        structure_match = re.search(r'Structure:\s*(\d+)', case_text)
+        structure_match = _search_from(_STRUCTURE_RE, case_text, sections, 'structure')
         if structure_match:
             metadata['structure_difficulty'] = int(structure_match.group(1))
         
         return metadata
     
-    def extract_case_prompt(self, case_text: str) -> Optional[str]:
+    def extract_case_prompt(self, case_text: str, sections: Optional[Dict[str, int]] = None) -> Optional[str]:
         """Extract the case prompt/scenario"""
-        prompt_match = re.search(
-            r'Case Prompt:\s*\n(.+?)(?=\n\n|Case Overview:|$)', 
-            case_text, 
-            re.DOTALL
-        )
+        if sections is None:
+            sections = self.index_sections(case_text)
+        prompt_match = _search_from(_PROMPT_RE, case_text, sections, 'prompt')
         if prompt_match:
             return prompt_match.group(1).strip()
         return None
     
-    def extract_case_overview(self, case_text: str) -> Dict:
+    def extract_case_overview(self, case_text: str, sections: Optional[Dict[str, int]] = None) -> Dict:
         """Extract case overview information"""
+        if sections is None:
+            sections = self.index_sections(case_text)
         overview = {}
         
         # Industry
-        industry_match = re.search(r'Industry:\s*(.+?)(?:\n|$)', case_text)
+        industry_match = _search_from(_INDUSTRY_RE, case_text, sections, 'industry')
         if industry_match:
             overview['industry'] = industry_match.group(1).strip()
         
         # Case Structure/Type
-        structure_match = re.search(r'Case Structure:\s*(.+?)(?:\n|Concepts)', case_text, re.DOTALL)
+        structure_match = _search_from(_CASE_STRUCTURE_RE, case_text, sections, 'case_structure')
         if structure_match:
             overview['case_type'] = structure_match.group(1).strip()
         
         # Concepts Tested
-        concepts_match = re.search(r'Concepts Tested:\s*(.+?)(?=\n\n|©|$)', case_text, re.DOTALL)
-        if concepts_match:
-            concepts_text = concepts_match.group(1).strip()
-            # Extract bullet points
-            concepts = re.findall(r'[•●]\s*(.+?)(?=\n|$)', concepts_text)
+        concepts_text = _section_body(case_text, sections, 'concepts', ('\n\n', '©'))
+        if concepts_text is not None:
+            # Extract bullet points (cheap literal check before running the regex)
+            concepts = []
+            if '•' in concepts_text or '●' in concepts_text:
+                concepts = _BULLET_RE.findall(concepts_text)
             overview['concepts_tested'] = [c.strip() for c in concepts]
         
         # Overview Information (tips for interviewer)
-        overview_info_match = re.search(
-            r'Overview Information for Interviewer:\s*(.+?)(?=\n\n|Clarifying|$)', 
-            case_text, 
-            re.DOTALL
-        )
-        if overview_info_match:
-            overview['interviewer_notes'] = overview_info_match.group(1).strip()
+        interviewer_notes = _section_body(case_text, sections, 'overview_info', ('\n\n', 'Clarifying'))
+        if interviewer_notes is not None:
+            overview['interviewer_notes'] = interviewer_notes
         
         return overview
     
-    def extract_framework_guide(self, case_text: str) -> Dict:
+    def extract_framework_guide(self, case_text: str, sections: Optional[Dict[str, int]] = None) -> Dict:
         """Extract the interviewer guide with expected framework"""
+        if sections is None:
+            sections = self.index_sections(case_text)
         framework = {}
         
         # Clarifying Information
-        clarifying_match = re.search(
-            r'Clarifying Information:\s*(.+?)(?=Interviewer Guide:|$)', 
-            case_text, 
-            re.DOTALL
-        )
-        if clarifying_match:
-            framework['clarifying_info'] = clarifying_match.group(1).strip()
+        clarifying_info = _section_body(case_text, sections, 'clarifying', ('Interviewer Guide:',))
+        if clarifying_info is not None:
+            framework['clarifying_info'] = clarifying_info
         
         # Interviewer Guide (expected framework)
-        guide_match = re.search(
-            r'Interviewer Guide:\s*(.+?)(?=\n\n\n|Question|Math|Brainstorming|Recommendation|$)', 
-            case_text, 
-            re.DOTALL
+        expected_framework = _section_body(
+            case_text, sections, 'guide',
+            ('\n\n\n', 'Question', 'Math', 'Brainstorming', 'Recommendation')
         )
-        if guide_match:
-            framework['expected_framework'] = guide_match.group(1).strip()
+        if expected_framework is not None:
+            framework['expected_framework'] = expected_framework
         
         return framework
     
-    def extract_questions(self, case_text: str) -> List[Dict]:
+    def extract_questions(self, case_text: str, sections: Optional[Dict[str, int]] = None) -> List[Dict]:
         """Extract all questions from the case"""
+        if sections is None:
+            sections = self.index_sections(case_text)
         questions = []
         
         # Find all question sections
-        question_sections = re.findall(
-            r'((?:Math|Brainstorming|Question)\s*(?:#?\d+)?:.*?(?=(?:Math|Brainstorming|Question|Recommendation:|Exhibit|$)))', 
-            case_text, 
-            re.DOTALL
-        )
+        question_sections = []
+        if 'question' in sections:
+            question_sections = _question_sections(case_text, sections['question'])
         
         for section in question_sections:
             question = {}
@@ -134,30 +337,31 @@ class CasebookParser:
                 question['type'] = 'general'
             
             # Extract the actual question
-            question_match = re.search(r':\s*(.+?)(?=\n\n|Math Solution|Notes to Interviewer|$)', section, re.DOTALL)
+            question_match = _QUESTION_PROMPT_RE.search(section)
             if question_match:
                 question['prompt'] = question_match.group(1).strip()
             
             # Extract solution/notes
-            solution_match = re.search(r'(?:Math Solution|Notes to Interviewer):\s*(.+?)$', section, re.DOTALL)
-            if solution_match:
-                question['solution_notes'] = solution_match.group(1).strip()
+            if 'Math Solution' in section or 'Notes to Interviewer' in section:
+                solution_match = _QUESTION_SOLUTION_RE.search(section)
+                if solution_match:
+                    question['solution_notes'] = solution_match.group(1).strip()
             
             if question:
                 questions.append(question)
         
         return questions
     
-    def extract_exhibits(self, case_text: str) -> List[Dict]:
+    def extract_exhibits(self, case_text: str, sections: Optional[Dict[str, int]] = None) -> List[Dict]:
         """Extract data exhibits/tables"""
+        if sections is None:
+            sections = self.index_sections(case_text)
         exhibits = []
         
         # Find exhibit sections
-        exhibit_sections = re.findall(
-            r'Exhibit\s+\d+.*?(?=Exhibit\s+\d+|Question|Recommendation|$)', 
-            case_text, 
-            re.DOTALL
-        )
+        exhibit_sections = []
+        if 'exhibit' in sections:
+            exhibit_sections = _EXHIBIT_RE.findall(case_text, sections['exhibit'])
         
         for idx, exhibit in enumerate(exhibit_sections):
             exhibits.append({
@@ -167,52 +371,75 @@ class CasebookParser:
         
         return exhibits
     
-    def extract_recommendation(self, case_text: str) -> Dict:
+    def extract_recommendation(self, case_text: str, sections: Optional[Dict[str, int]] = None) -> Dict:
         """Extract the recommendation structure"""
+        if sections is None:
+            sections = self.index_sections(case_text)
         recommendation = {}
         
         # Find recommendation section
-        rec_match = re.search(
-            r'Recommendation:.*?(?=Bonus:|©|$)', 
-            case_text, 
-            re.DOTALL
-        )
-        
-        if rec_match:
-            rec_section = rec_match.group(0)
+        rec_start = sections.get('recommendation')
+        
+        if rec_start is not None:
+            rec_end = _find_first(case_text, ('Bonus:', '©'), rec_start + len('Recommendation:'))
+            if rec_end < 0:
+                # Keep the old `$` terminator's behaviour of stopping before a trailing newline
+                rec_end = len(case_text) - 1 if case_text.endswith('\n') else len(case_text)
+            rec_section = case_text[rec_start:rec_end]
             
             # Extract recommendation points
-            rec_points = re.search(r'Recommendation:\s*(.+?)(?=Risks:|Next Steps:|$)', rec_section, re.DOTALL)
-            if rec_points:
-                recommendation['recommendation'] = rec_points.group(1).strip()
+            rec_points = _body_after(rec_section, len('Recommendation:'), ('Risks:', 'Next Steps:'))
+            if rec_points is not None:
+                recommendation['recommendation'] = rec_points
             
             # Extract risks
-            risks_match = re.search(r'Risks:\s*(.+?)(?=Next Steps:|$)', rec_section, re.DOTALL)
-            if risks_match:
-                recommendation['risks'] = risks_match.group(1).strip()
+            risks_pos = rec_section.find('Risks:')
+            if risks_pos >= 0:
+                risks = _body_after(rec_section, risks_pos + len('Risks:'), ('Next Steps:',))
+                if risks is not None:
+                    recommendation['risks'] = risks
             
             # Extract next steps
-            steps_match = re.search(r'Next Steps:\s*(.+?)(?=Bonus:|$)', rec_section, re.DOTALL)
-            if steps_match:
-                recommendation['next_steps'] = steps_match.group(1).strip()
-        
-        # Extract bonus tips
-        bonus_match = re.search(r'Bonus:.*?\n(.+?)(?=©|$)', case_text, re.DOTALL)
-        if bonus_match:
-            recommendation['excellence_tips'] = bonus_match.group(1).strip()
+            steps_pos = rec_section.find('Next Steps:')
+            if steps_pos >= 0:
+                next_steps = _body_after(rec_section, steps_pos + len('Next Steps:'), ('Bonus:',))
+                if next_steps is not None:
+                    recommendation['next_steps'] = next_steps
+        
+        # Extract bonus tips (everything from the line after "Bonus:" up to the footer)
+        bonus_pos = sections.get('bonus')
+        if bonus_pos is not None:
+            line_end = case_text.find('\n', bonus_pos + len('Bonus:'))
+            if 0 <= line_end < len(case_text) - 1:
+                tips_end = case_text.find('©', line_end + 2)
+                recommendation['excellence_tips'] = case_text[line_end + 1:tips_end if tips_end >= 0 else None].strip()
         
         return recommendation
     
+    def index_sections(self, case_text: str) -> Dict[str, int]:
+        """Map each section header to the offset of its first occurrence in the case"""
+        sections = {}
+        for key, headers in _SECTION_HEADERS.items():
+            offsets = [pos for pos in (case_text.find(h) for h in headers) if pos >= 0]
+            if offsets:
+                sections[key] = min(offsets)
+        for key, pattern in _CI_SECTION_RES.items():
+            match = pattern.search(case_text)
+            if match:
+                sections[key] = match.start()
+        return sections
+    
     def parse_case(self, case_text: str) -> Dict:
         """Parse a single case into structured JSON"""
+        sections = self.index_sections(case_text)
         case_data = {
-            'metadata': self.extract_case_metadata(case_text),
-            'case_prompt': self.extract_case_prompt(case_text),
-            'overview': self.extract_case_overview(case_text),
-            'framework_guide': self.extract_framework_guide(case_text),
-            'questions': self.extract_questions(case_text),
-            'exhibits': self.extract_exhibits(case_text),
-            'recommendation': self.extract_recommendation(case_text)
+            'metadata': self.extract_case_metadata(case_text, sections),
+            'case_prompt': self.extract_case_prompt(case_text, sections),
+            'overview': self.extract_case_overview(case_text, sections),
+            'framework_guide': self.extract_framework_guide(case_text, sections),
+            'questions': self.extract_questions(case_text, sections),
+            'exhibits': self.extract_exhibits(case_text, sections),
+            'recommendation': self.extract_recommendation(case_text, sections)
         }
         
         # Generate a unique ID for DynamoDB
@@ -222,84 +449,120 @@ class CasebookParser:
     
     def split_cases(self) -> List[str]:
         """Split the full text into individual cases"""
-        # Find where first Author: appears in practice cases section
-        lines = self.full_text.split('\n')
-        
-        # Find "Practice Cases" section start
-        practice_start_line = -1
-        for i, line in enumerate(lines):
-            if 'Practice Cases' in line and i > 1000:  # Should be towards end
-                practice_start_line = i
+        # Works on offsets into the unsplit text rather than a list of lines, so the
+        # casebook is never copied into one Python string per line
+        text = self.full_text
+        
+        # Find "Practice Cases" section start; it should be past the first 1000 lines
+        min_offset = 0
+        for _ in range(1001):
+            min_offset = text.find('\n', min_offset) + 1
+            if min_offset == 0:
                 break
+        practice_pos = text.find('Practice Cases', min_offset) if min_offset else -1
         
-        if practice_start_line == -1:
+        if practice_pos == -1:
             print("Could not find Practice Cases section")
             return []
         
+        practice_start = text.rfind('\n', 0, practice_pos) + 1
+        practice_start_line = text.count('\n', 0, practice_start)
         print(f"Found Practice Cases at line {practice_start_line}")
         
         # Find all "Author:" lines after this point
         case_starts = []
-        for i in range(practice_start_line, len(lines)):
-            line = lines[i].strip()
-            if line.startswith('Author'):
-                # Look back for title (non-empty, non-numeric line before Author)
-                title = None
-                for j in range(i-1, max(practice_start_line, i-10), -1):
-                    potential_title = lines[j].strip()
-                    if potential_title and not potential_title.isdigit() and len(potential_title) > 3:
-                        # Avoid page numbers and other junk
-                        if not re.match(r'^\d+$', potential_title) and not potential_title.startswith('©'):
-                            title = potential_title
-                            break
-                
-                if title:
-                    case_starts.append({
-                        'line_num': i,
-                        'title': title
-                    })
-                    print(f"  Found case: {title} at line {i}")
+        line_num, counted_to = practice_start_line, practice_start
+        for author_match in _AUTHOR_LINE_RE.finditer(text, practice_start):
+            line_start = author_match.start()
+            line_num += text.count('\n', counted_to, line_start)
+            counted_to = line_start
+            
+            # Look back up to 9 lines (not past the section start) for the title
+            title = None
+            prev_end = line_start - 1
+            for _ in range(min(9, line_num - practice_start_line - 1)):
+                prev_start = text.rfind('\n', 0, prev_end) + 1
+                potential_title = text[prev_start:prev_end].strip()
+                if potential_title and not potential_title.isdigit() and len(potential_title) > 3:
+                    # Avoid page numbers and other junk
+                    if not _DIGITS_RE.match(potential_title) and not potential_title.startswith('©'):
+                        title = potential_title
+                        break
+                prev_end = prev_start - 1
+            
+            if title:
+                case_starts.append({
+                    'line_num': line_num,
+                    # Cases start one line above "Author" to include the title
+                    'offset': text.rfind('\n', 0, line_start - 1) + 1,
+                    'title': title
+                })
+                print(f"  Found case: {title} at line {line_num}")
         
         print(f"\nFound {len(case_starts)} cases total")
         
         # Split cases
         cases = []
         for i, start_info in enumerate(case_starts):
-            start_line = start_info['line_num'] - 1  # Include title
             # Find where this case ends (start of next case or end of file)
             if i + 1 < len(case_starts):
-                end_line = case_starts[i+1]['line_num'] - 1
+                end = case_starts[i+1]['offset'] - 1
             else:
-                end_line = len(lines)
+                end = len(text)
             
-            case_lines = lines[start_line:end_line]
-            case_text = '\n'.join(case_lines)
+            case_text = text[start_info['offset']:end]
             
             if len(case_text.strip()) > 200:
                 cases.append(case_text)
         
         return cases
     
-    def parse_all_cases(self) -> List[Dict]:
-        """Parse all cases in the document"""
+    def parse_all_cases(self, workers: Optional[int] = 1, cache_path: Optional[str] = None) -> List[Dict]:
+        """Parse all cases in the document
+
+        workers > 1 spreads the cases over a process pool (None means one process per CPU).
+        Process startup usually costs more than a single casebook takes to parse in-process,
+        so this pays off for large or many casebooks.
+
+        cache_path names a shelve file of previously parsed cases keyed by a hash of the case
+        text and the parser class, so re-runs only parse cases that are new or changed since the
+        last run.
+        """
         case_texts = self.split_cases()
         
-        for case_text in case_texts:
-            try:
-                case_data = self.parse_case(case_text)
-                # Only add if we extracted meaningful data
-                if case_data['metadata'].get('title'):
-                    self.cases.append(case_data)
-            except Exception as e:
-                print(f"Error parsing case: {str(e)[:100]}")
+        if cache_path is None:
+            results = self._parse_case_texts(case_texts, workers)
+        else:
+            with shelve.open(cache_path) as cache:
+                keys = [_case_cache_key(type(self), case_text) for case_text in case_texts]
+                missing = [i for i, key in enumerate(keys) if key not in cache]
+                fresh = dict(zip(missing, self._parse_case_texts([case_texts[i] for i in missing], workers)))
+                for i, (case_data, error) in fresh.items():
+                    if error is None:
+                        cache[keys[i]] = case_data
+                results = [fresh[i] if i in fresh else (cache[key], None) for i, key in enumerate(keys)]
+                print(f"Reused {len(keys) - len(missing)} cached cases, parsed {len(missing)}")
+        
+        for case_data, error in results:
+            if error is not None:
+                print(f"Error parsing case: {error[:100]}")
                 continue
+            # Only add if we extracted meaningful data
+            if case_data['metadata'].get('title'):
+                self.cases.append(case_data)
         
         return self.cases
     
+    def _parse_case_texts(self, case_texts: List[str], workers: Optional[int]) -> List[tuple]:
+        """(case_data, error) for each case text, in-process or on a process pool"""
+        if workers == 1 or not case_texts:
+            return [_parse_case_safely(self, case_text) for case_text in case_texts]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(type(self),)) as executor:
+            return list(executor.map(_parse_in_worker, case_texts, chunksize=8))
+    
     def save_to_json(self, output_path: str):
         """Save parsed cases to JSON file"""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(self.cases, f, indent=2, ensure_ascii=False)
+        write_json(self.cases, output_path)
         
         print(f"Saved {len(self.cases)} cases to {output_path}")
 
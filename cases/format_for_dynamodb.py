@@ -1,8 +1,68 @@
 import re
 import json
-from datetime import datetime
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
 from NYU_Stern_Parser import CasebookParser
 
+try:
+    import orjson  # C-accelerated JSON serialization, optional
+except ImportError:
+    orjson = None
+
+# Titles matching this are page furniture, not real cases
+_INVALID_TITLE_RE = re.compile(r'^(?:Structure:|\d+$|©|Page \d+|Exhibit|Question \d+)', re.IGNORECASE)
+
+@dataclass(slots=True)
+class DynamoDBCaseItem:
+    """One CaseStudies item; field order is the attribute order in the written JSON"""
+    # Primary key ID
+    case_id: str
+    
+    # Metadata
+    title: str
+    author: str
+    firm_style: str
+    case_style: str
+    
+    # Case categorization
+    industry: str
+    case_type: str
+    
+    # Difficulty ratings ({'quant': int, 'structure': int})
+    difficulty: Dict[str, int]
+    
+    # Skills tested
+    concepts_tested: List[str]
+    
+    # Case content
+    case_prompt: Optional[str]
+    clarifying_info: str
+    expected_framework: str
+    interviewer_notes: str
+    
+    # Questions and exhibits
+    questions: List[Dict]
+    exhibits: List[Dict]
+    
+    # Recommendation
+    recommendation: Dict
+    
+    # Metadata Timestamps
+    created_at: str
+    updated_at: str
+
+
+def json_line(item: DynamoDBCaseItem) -> bytes:
+    """Serialize item as one compact UTF-8 NDJSON line.
+
+    orjson, when installed, serializes the dataclass natively; the json fallback converts it first.
+    """
+    if orjson is not None:
+        return orjson.dumps(item) + b'\n'
+    return json.dumps(asdict(item), ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
 class DynamoDBCaseFormatter:
     """Format parsed cases for DynamoDB-ready JSON format"""
     
@@ -12,18 +72,8 @@ class DynamoDBCaseFormatter:
         title = case_data['metadata'].get('title', '')
         
         # Filter out cases that are clearly not real cases
-        invalid_patterns = [
-            r'^Structure:',
-            r'^\d+$',
-            r'^©',
-            r'^Page \d+',
-            r'^Exhibit',
-            r'^Question \d+'
-        ]
-        
-        for pattern in invalid_patterns:
-            if re.match(pattern, title, re.IGNORECASE):
-                return False
+        if _INVALID_TITLE_RE.match(title):
+            return False
         
         # Title must be long enough to be a name
         if len(title) < 5:
@@ -36,54 +86,42 @@ class DynamoDBCaseFormatter:
         return True
     
     @staticmethod
-    def format_for_dynamodb(case_data: dict) -> dict:
-        """Transform raw parsed data into a clean, standardized schema"""
-        metadata = case_data.get('metadata', {})
-        overview = case_data.get('overview', {})
-        framework = case_data.get('framework_guide', {})
+    def format_for_dynamodb(case_data: dict, now_iso: Optional[str] = None) -> DynamoDBCaseItem:
+        """Transform raw parsed data into a clean, standardized schema
+
+        now_iso is the batch timestamp for created_at/updated_at; defaults to the current UTC time.
+        """
+        if now_iso is None:
+            now_iso = datetime.now(timezone.utc).isoformat()
+        # Bind the lookups once; each is called several times below
+        cd_get = case_data.get
+        md_get = cd_get('metadata', {}).get
+        ov_get = cd_get('overview', {}).get
+        fw_get = cd_get('framework_guide', {}).get
         
-        item = {
-            # Primary key ID
-            'case_id': case_data.get('case_id', ''),
-            
-            # Metadata
-            'title': metadata.get('title', ''),
-            'author': metadata.get('author', ''),
-            'firm_style': metadata.get('firm_style', ''),
-            'case_style': metadata.get('case_style', ''),
-            
-            # Case categorization
-            'industry': overview.get('industry', ''),
-            'case_type': overview.get('case_type', ''),
-            
-            # Difficulty ratings
-            'difficulty': {
-                'quant': metadata.get('quant_difficulty', 0),
-                'structure': metadata.get('structure_difficulty', 0)
+        return DynamoDBCaseItem(
+            cd_get('case_id', ''),
+            md_get('title', ''),
+            md_get('author', ''),
+            md_get('firm_style', ''),
+            md_get('case_style', ''),
+            ov_get('industry', ''),
+            ov_get('case_type', ''),
+            {
+                'quant': md_get('quant_difficulty', 0),
+                'structure': md_get('structure_difficulty', 0)
             },
-            
-            # Skills tested
-            'concepts_tested': overview.get('concepts_tested', []),
-            
-            # Case content
-            'case_prompt': case_data.get('case_prompt', ''),
-            'clarifying_info': framework.get('clarifying_info', ''),
-            'expected_framework': framework.get('expected_framework', ''),
-            'interviewer_notes': overview.get('interviewer_notes', ''),
-            
-            # Questions and exhibits
-            'questions': case_data.get('questions', []),
-            'exhibits': case_data.get('exhibits', []),
-            
-            # Recommendation
-            'recommendation': case_data.get('recommendation', {}),
-            
-            # Metadata Timestamps
-            'created_at': datetime.utcnow().isoformat(),
-            'updated_at': datetime.utcnow().isoformat()
-        }
-        
-        return item
+            ov_get('concepts_tested', []),
+            cd_get('case_prompt', ''),
+            fw_get('clarifying_info', ''),
+            fw_get('expected_framework', ''),
+            ov_get('interviewer_notes', ''),
+            cd_get('questions', []),
+            cd_get('exhibits', []),
+            cd_get('recommendation', {}),
+            now_iso,
+            now_iso
+        )
 
 
 def main():
@@ -94,8 +132,8 @@ def main():
     
     # 1. Path to your raw text file
     input_text_file = '2025_NYU_Stern_pdf_output.txt'
-    # 2. Path to your desired output file
-    output_json_file = 'PARSED_2025_NYU_Stern_DYNAMO.json'
+    # 2. Path to your desired output file (NDJSON: one DynamoDB item per line)
+    output_json_file = 'PARSED_2025_NYU_Stern_DYNAMO.ndjson'
     
     try:
         # Initialize Parser
@@ -103,24 +141,27 @@ def main():
         raw_cases = parser.parse_all_cases()
         print(f"\n[1/3] Initial parsing found: {len(raw_cases)} potential cases")
         
-        # Filter and format
+        # Filter and format, writing each item out as soon as it is built
         formatter = DynamoDBCaseFormatter()
-        valid_cases = []
+        preview_cases = []
+        valid_count = 0
         invalid_count = 0
+        # One timestamp for the whole batch
+        now_iso = datetime.now(timezone.utc).isoformat()
         
-        for case in raw_cases:
-            if formatter.is_valid_case(case):
-                dynamodb_item = formatter.format_for_dynamodb(case)
-                valid_cases.append(dynamodb_item)
-            else:
-                invalid_count += 1
+        with open(output_json_file, 'wb') as f:
+            for case in raw_cases:
+                if formatter.is_valid_case(case):
+                    dynamodb_item = formatter.format_for_dynamodb(case, now_iso)
+                    f.write(json_line(dynamodb_item))
+                    valid_count += 1
+                    if len(preview_cases) < 5:
+                        preview_cases.append(dynamodb_item)
+                else:
+                    invalid_count += 1
         
         print(f"[2/3] Filtered out {invalid_count} junk items")
-        print(f"[3/3] Successfully formatted {len(valid_cases)} valid cases")
-        
-        # Save to JSON
-        with open(output_json_file, 'w', encoding='utf-8') as f:
-            json.dump(valid_cases, f, indent=2, ensure_ascii=False)
+        print(f"[3/3] Successfully formatted {valid_count} valid cases")
         
         print(f"\n✅ SUCCESS: File saved as {output_json_file}")
         
@@ -128,10 +169,10 @@ def main():
         print("\n" + "=" * 60)
         print("SUMMARY PREVIEW (First 5 Cases)")
         print("=" * 60)
-        for case in valid_cases[:5]:
-            print(f"• {case['title']} ({case['industry']})")
-            print(f"  - Type: {case['case_type']}")
-            print(f"  - Questions: {len(case['questions'])}")
+        for case in preview_cases:
+            print(f"• {case.title} ({case.industry})")
+            print(f"  - Type: {case.case_type}")
+            print(f"  - Questions: {len(case.questions)}")
         
     except FileNotFoundError:
         print(f"Error: Could not find the file '{input_text_file}'. Make sure it is in the same folder.")